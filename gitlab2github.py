@@ -7,20 +7,28 @@ Issues、Merge Requests、Wiki、Labels、Milestonesを含む完全な移行を
 import os
 import sys
 import json
+import base64
 import time
+import asyncio
+import sqlite3
+import tempfile
 import logging
 import argparse
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from dotenv import load_dotenv
 from tqdm import tqdm
 import re
-import subprocess
 
 import gitlab
-from github import Github
+from github import Github, GithubException
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ログ設定
 logging.basicConfig(
@@ -33,6 +41,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# GitHub APIのエンドポイント
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# ASCII制御文字（0x00-0x1F, 0x7F）を除去するstr.translate用テーブル
+_CTRL_TRANS = dict.fromkeys(list(range(0x00, 0x20)) + [0x7F])
+
+# 作成済みIssue/PR本文に埋め込む移行元iidマーカー（再実行時の重複判定に使用）
+_GITLAB_IID_RE = re.compile(r'gitlab-iid:\s*(\d+)')
+_GITLAB_MR_IID_RE = re.compile(r'gitlab-mr-iid:\s*(\d+)')
+
+
+def _label_names(labels) -> List[str]:
+    """ラベルを文字列のリストへ正規化（オブジェクト/文字列の型判定はここで1回だけ行う）"""
+    return [l.name if hasattr(l, 'name') else l
+            for l in labels
+            if isinstance(l, str) or hasattr(l, 'name')]
+
 
 @dataclass
 class MigrationConfig:
@@ -49,6 +75,39 @@ class MigrationConfig:
     migrate_milestones: bool = True
     target_repo: Optional[str] = None  # 特定のリポジトリ名
     force_private: bool = False        # すべてprivateで作成するか
+    concurrency: int = 4               # 同時に移行するリポジトリ数
+    git_concurrency: int = 2           # 同時に実行するgit clone/push数
+    partial_clone: bool = False        # --filter=blob:none で部分クローンするか
+    http_concurrency: int = 8          # GitHubへの同時HTTPリクエスト数（Issue作成）
+    mirror_cache_dir: str = '~/.cache/gitlab2github'  # ミラーを保持するディレクトリ（空なら毎回一時ディレクトリ）
+    state_db: str = 'migration_state.sqlite'          # 移行済みオブジェクトを記録するチェックポイントDB
+
+
+@dataclass(slots=True, frozen=True)
+class RepoInfo:
+    """移行対象リポジトリの情報（dictよりコンパクトで属性アクセスも速い）"""
+    id: int
+    name: str
+    path: str
+    description: Optional[str]
+    visibility: str
+    web_url: str
+    ssh_url_to_repo: str
+    http_url_to_repo: str
+
+    @classmethod
+    def from_project(cls, project) -> 'RepoInfo':
+        """python-gitlabのProjectオブジェクトから生成"""
+        return cls(
+            id=project.id,
+            name=project.name,
+            path=project.path,
+            description=project.description,
+            visibility=project.visibility,
+            web_url=project.web_url,
+            ssh_url_to_repo=project.ssh_url_to_repo,
+            http_url_to_repo=project.http_url_to_repo
+        )
 
 
 class GitLabToGitHubMigrator:
@@ -56,34 +115,161 @@ class GitLabToGitHubMigrator:
 
     def __init__(self, config: MigrationConfig):
         self.config = config
-        self.gitlab = gitlab.Gitlab(url=config.gitlab_url, private_token=config.gitlab_token)
-        self.github = Github(config.github_token)
-        self.github_org = self.github.get_organization(config.github_org)
 
-        # 移行マッピングを保存
-        self.user_mapping = {}
-        self.label_mapping = {}
-        self.milestone_mapping = {}
+        # HTTPコネクションを使い回す共有セッション（keep-alive + 429/5xxの自動リトライ）
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retry))
 
-    def get_gitlab_repositories(self) -> List[Dict]:
+        self.gitlab = gitlab.Gitlab(url=config.gitlab_url, private_token=config.gitlab_token, session=self.session)
+        self.github = Github(config.github_token, retry=retry, pool_size=64, per_page=100)
+        self.github_org = self.github.get_organization(config.github_org)
+
+        # packfile転送の同時実行数を制限するセマフォ
+        self._git_semaphore = threading.BoundedSemaphore(max(1, config.git_concurrency))
+
+        # レート制限チェックの間引き用（毎回 /rate_limit を叩かない）
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_checked_at = 0.0
+
+        # 取得済みGitHub Repositoryオブジェクトのキャッシュ（リポジトリ名→オブジェクト）
+        self._gh_repo_cache: Dict[str, Any] = {}
+
+        # ローカルチェックポイントDB（再実行時にAPIを読まずスキップするための記録）
+        self._db_lock = threading.Lock()
+        self.db = sqlite3.connect(os.path.expanduser(config.state_db), check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS done(repo TEXT, kind TEXT, iid INTEGER, gh INTEGER, "
+            "PRIMARY KEY(repo, kind, iid))"
+        )
+        self.db.commit()
+
+    def _checkpoint_done(self, repo: str, kind: str, iid: int) -> bool:
+        """指定オブジェクトが移行済みとして記録されているかを返す"""
+        with self._db_lock:
+            row = self.db.execute(
+                "SELECT 1 FROM done WHERE repo=? AND kind=? AND iid=?", (repo, kind, iid)
+            ).fetchone()
+        return row is not None
+
+    def _checkpoint_record(self, repo: str, kind: str, iid: int, gh_number: Optional[int] = None):
+        """オブジェクト作成の成功をチェックポイントへ記録"""
+        with self._db_lock:
+            self.db.execute(
+                "INSERT OR IGNORE INTO done(repo, kind, iid, gh) VALUES (?, ?, ?, ?)",
+                (repo, kind, iid, gh_number)
+            )
+            self.db.commit()
+
+    def _github_graphql(self, query: str, variables: Dict[str, Any]) -> Dict:
+        """GitHub GraphQL APIへクエリを投げてdata部を返す"""
+        response = self.session.post(
+            GITHUB_GRAPHQL_URL,
+            json={'query': query, 'variables': variables},
+            headers={'Authorization': f'bearer {self.config.github_token}'}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get('errors'):
+            raise RuntimeError(f"GraphQLクエリが失敗しました: {payload['errors']}")
+        return payload['data']
+
+    def _prefetch_github_state(self, repo_name: str) -> Dict[str, Any]:
+        """移行前に必要なGitHub側の既存状態を1つのGraphQLクエリで先読みする
+
+        ラベル名・マイルストーン（タイトル→番号）・既存Issue/PR本文のiidマーカーを
+        labels/milestones/issues/pullRequestsの4コネクションをカーソルを揃えて
+        ページングしながら収集し、従来の3つのREST走査を1往復/ページに圧縮する。
+        """
+        query = """
+        query($owner: String!, $name: String!,
+              $labelCursor: String, $milestoneCursor: String,
+              $issueCursor: String, $prCursor: String,
+              $fetchLabels: Boolean!, $fetchMilestones: Boolean!,
+              $fetchIssues: Boolean!, $fetchPrs: Boolean!) {
+          repository(owner: $owner, name: $name) {
+            labels(first: 100, after: $labelCursor) @include(if: $fetchLabels) {
+              nodes { name }
+              pageInfo { hasNextPage endCursor }
+            }
+            milestones(first: 100, after: $milestoneCursor) @include(if: $fetchMilestones) {
+              nodes { number title }
+              pageInfo { hasNextPage endCursor }
+            }
+            issues(first: 100, after: $issueCursor) @include(if: $fetchIssues) {
+              nodes { body }
+              pageInfo { hasNextPage endCursor }
+            }
+            pullRequests(first: 100, after: $prCursor) @include(if: $fetchPrs) {
+              nodes { body }
+              pageInfo { hasNextPage endCursor }
+            }
+          }
+        }
+        """
+        state = {
+            'label_names': set(),   # GitHub側の既存ラベル名
+            'milestones': {},       # タイトル→マイルストーン番号
+            'issue_iids': set(),    # 既存Issueの移行元iid
+            'mr_iids': set(),       # 既存PR・スキップ記録Issueの移行元MR iid
+        }
+        cursors = {'labels': None, 'milestones': None, 'issues': None, 'pullRequests': None}
+        fetch = {'labels': True, 'milestones': True, 'issues': True, 'pullRequests': True}
+
+        while any(fetch.values()):
+            data = self._github_graphql(query, {
+                'owner': self.config.github_org, 'name': repo_name,
+                'labelCursor': cursors['labels'], 'milestoneCursor': cursors['milestones'],
+                'issueCursor': cursors['issues'], 'prCursor': cursors['pullRequests'],
+                'fetchLabels': fetch['labels'], 'fetchMilestones': fetch['milestones'],
+                'fetchIssues': fetch['issues'], 'fetchPrs': fetch['pullRequests'],
+            })
+            repository = data['repository']
+
+            if fetch['labels']:
+                conn = repository['labels']
+                state['label_names'].update(node['name'] for node in conn['nodes'])
+                fetch['labels'] = conn['pageInfo']['hasNextPage']
+                cursors['labels'] = conn['pageInfo']['endCursor']
+
+            if fetch['milestones']:
+                conn = repository['milestones']
+                state['milestones'].update({node['title']: node['number'] for node in conn['nodes']})
+                fetch['milestones'] = conn['pageInfo']['hasNextPage']
+                cursors['milestones'] = conn['pageInfo']['endCursor']
+
+            if fetch['issues']:
+                conn = repository['issues']
+                for node in conn['nodes']:
+                    body = node['body'] or ''
+                    m = _GITLAB_IID_RE.search(body)
+                    if m:
+                        state['issue_iids'].add(int(m.group(1)))
+                    # スキップされたMRはIssueとして記録されるのでMRマーカーも見る
+                    m = _GITLAB_MR_IID_RE.search(body)
+                    if m:
+                        state['mr_iids'].add(int(m.group(1)))
+                fetch['issues'] = conn['pageInfo']['hasNextPage']
+                cursors['issues'] = conn['pageInfo']['endCursor']
+
+            if fetch['pullRequests']:
+                conn = repository['pullRequests']
+                for node in conn['nodes']:
+                    m = _GITLAB_MR_IID_RE.search(node['body'] or '')
+                    if m:
+                        state['mr_iids'].add(int(m.group(1)))
+                fetch['pullRequests'] = conn['pageInfo']['hasNextPage']
+                cursors['pullRequests'] = conn['pageInfo']['endCursor']
+
+        return state
+
+    def get_gitlab_repositories(self) -> List[RepoInfo]:
         """GitLabグループ内の全リポジトリを取得"""
         try:
             group = self.gitlab.groups.get(self.config.gitlab_group_id)
-            projects = group.projects.list(all=True)
+            projects = group.projects.list(iterator=True, per_page=100)
 
-            repositories = []
-            for project in projects:
-                repo_info = {
-                    'id': project.id,
-                    'name': project.name,
-                    'path': project.path,
-                    'description': project.description,
-                    'visibility': project.visibility,
-                    'web_url': project.web_url,
-                    'ssh_url_to_repo': project.ssh_url_to_repo,
-                    'http_url_to_repo': project.http_url_to_repo
-                }
-                repositories.append(repo_info)
+            repositories = [RepoInfo.from_project(project) for project in projects]
 
             logger.info(f"GitLabグループから {len(repositories)} 個のリポジトリを取得しました")
             return repositories
@@ -92,26 +278,16 @@ class GitLabToGitHubMigrator:
             logger.error(f"GitLabリポジトリの取得に失敗しました: {e}")
             return []
 
-    def get_specific_repository(self, repo_name: str) -> Optional[Dict]:
+    def get_specific_repository(self, repo_name: str) -> Optional[RepoInfo]:
         """特定のリポジトリを取得"""
         try:
             group = self.gitlab.groups.get(self.config.gitlab_group_id)
-            projects = group.projects.list(all=True)
+            projects = group.projects.list(iterator=True, per_page=100)
 
             for project in projects:
                 if project.name == repo_name:
-                    repo_info = {
-                        'id': project.id,
-                        'name': project.name,
-                        'path': project.path,
-                        'description': project.description,
-                        'visibility': project.visibility,
-                        'web_url': project.web_url,
-                        'ssh_url_to_repo': project.ssh_url_to_repo,
-                        'http_url_to_repo': project.http_url_to_repo
-                    }
                     logger.info(f"リポジトリ {repo_name} を取得しました")
-                    return repo_info
+                    return RepoInfo.from_project(project)
 
             logger.error(f"リポジトリ {repo_name} が見つかりませんでした")
             return None
@@ -124,19 +300,23 @@ class GitLabToGitHubMigrator:
         """descriptionからGitHubが許可しない制御文字を除去"""
         if not description:
             return ''
-        # ASCII制御文字（0x00-0x1F, 0x7F）を除去
-        return re.sub(r'[\x00-\x1F\x7F]', '', description)
+        # C実装のtranslateで一括除去（正規表現より数倍速い）
+        return description.translate(_CTRL_TRANS)
 
-    def create_github_repository(self, repo_info: Dict) -> Optional[str]:
-        """GitHubにリポジトリを作成（既存ならスキップしてURL返す）"""
+    def create_github_repository(self, repo_info: RepoInfo) -> Optional[Any]:
+        """GitHubにリポジトリを作成し、Repositoryオブジェクトを返す（既存ならそのまま返す）"""
         try:
-            repo_name = repo_info['name']
+            repo_name = repo_info.name
+
+            if repo_name in self._gh_repo_cache:
+                return self._gh_repo_cache[repo_name]
 
             # リポジトリが既に存在するかチェック
             try:
                 existing_repo = self.github_org.get_repo(repo_name)
                 logger.warning(f"リポジトリ {repo_name} は既に存在します（pushで上書きします）")
-                return existing_repo.clone_url
+                self._gh_repo_cache[repo_name] = existing_repo
+                return existing_repo
             except Exception:
                 pass
 
@@ -144,10 +324,10 @@ class GitLabToGitHubMigrator:
             if self.config.force_private:
                 visibility = 'private'
             else:
-                visibility = 'private' if repo_info['visibility'] == 'private' else 'public'
+                visibility = 'private' if repo_info.visibility == 'private' else 'public'
 
             # descriptionの制御文字を除去
-            safe_description = self.sanitize_description(repo_info.get('description', ''))
+            safe_description = self.sanitize_description(repo_info.description)
 
             repo = self.github_org.create_repo(
                 name=repo_name,
@@ -157,210 +337,455 @@ class GitLabToGitHubMigrator:
             )
 
             logger.info(f"GitHubリポジトリ {repo_name} を作成しました (visibility: {visibility})")
-            return repo.clone_url
+            self._gh_repo_cache[repo_name] = repo
+            return repo
 
         except Exception as e:
-            logger.error(f"GitHubリポジトリ {repo_info['name']} の作成に失敗しました: {e}")
+            logger.error(f"GitHubリポジトリ {repo_info.name} の作成に失敗しました: {e}")
             return None
 
-    def migrate_labels(self, gitlab_project, github_repo):
+    def _create_one_label(self, github_repo, label, github_label_names: Optional[set] = None):
+        """ラベルを1件作成し、成功したらラベル名キャッシュへ反映"""
+        try:
+            # ラベルの色を16進数に変換
+            color = label.color.lstrip('#') if label.color.startswith('#') else label.color
+
+            self._call_with_backoff(
+                github_repo.create_label,
+                name=label.name,
+                color=color,
+                description=label.description or ''
+            )
+            if github_label_names is not None:
+                github_label_names.add(label.name)
+            logger.info(f"ラベル {label.name} を移行しました")
+
+        except GithubException as e:
+            # 既に存在する場合（422）も付与可能なのでキャッシュへ反映する
+            if e.status == 422 and github_label_names is not None:
+                github_label_names.add(label.name)
+            logger.warning(f"ラベル {label.name} の移行に失敗しました: {e}")
+
+        except Exception as e:
+            logger.warning(f"ラベル {label.name} の移行に失敗しました: {e}")
+
+    def migrate_labels(self, gitlab_project, github_repo, gl_labels: Optional[List] = None,
+                       gh_state: Optional[Dict] = None):
         """ラベルの移行"""
         if not self.config.migrate_labels:
             return
 
         try:
-            labels = gitlab_project.labels.list()
-
-            for label in labels:
-                try:
-                    # ラベルの色を16進数に変換
-                    color = label.color.lstrip('#') if label.color.startswith('#') else label.color
+            labels = gl_labels if gl_labels is not None else gitlab_project.labels.list(get_all=True, per_page=100)
 
-                    github_repo.create_label(
-                        name=label.name,
-                        color=color,
-                        description=label.description or ''
-                    )
-                    logger.info(f"ラベル {label.name} を移行しました")
+            # 先読みしたラベル名セットに作成結果を反映し、後続のIssue/MR移行で使い回す
+            github_label_names = gh_state['label_names'] if gh_state else None
 
-                except Exception as e:
-                    logger.warning(f"ラベル {label.name} の移行に失敗しました: {e}")
+            # ラベル同士は独立したリソースなので並列に作成できる
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(self._create_one_label, github_repo, label, github_label_names)
+                           for label in labels]
+                for future in as_completed(futures):
+                    future.result()
 
         except Exception as e:
             logger.error(f"ラベルの移行に失敗しました: {e}")
 
-    def migrate_milestones(self, gitlab_project, github_repo):
-        """マイルストーンの移行"""
-        if not self.config.migrate_milestones:
-            return
-
+    def _create_one_milestone(self, github_repo, milestone) -> Optional[tuple]:
+        """マイルストーンを1件作成し、(GitLab ID, GitHub番号) を返す"""
         try:
-            milestones = gitlab_project.milestones.list()
+            # マイルストーンの状態を設定
+            state = 'closed' if milestone.state == 'closed' else 'open'
+
+            gh_milestone = self._call_with_backoff(
+                github_repo.create_milestone,
+                title=milestone.title,
+                description=milestone.description or '',
+                state=state
+            )
 
-            for milestone in milestones:
-                try:
-                    # マイルストーンの状態を設定
-                    state = 'closed' if milestone.state == 'closed' else 'open'
+            logger.info(f"マイルストーン {milestone.title} を移行しました")
+            return (milestone.id, gh_milestone.number)
 
-                    gh_milestone = github_repo.create_milestone(
-                        title=milestone.title,
-                        description=milestone.description or '',
-                        state=state
-                    )
+        except Exception as e:
+            logger.warning(f"マイルストーン {milestone.title} の移行に失敗しました: {e}")
+            return None
 
-                    # マッピングを保存
-                    self.milestone_mapping[milestone.id] = gh_milestone.number
+    def migrate_milestones(self, gitlab_project, github_repo, gl_milestones: Optional[List] = None,
+                           gh_state: Optional[Dict] = None) -> Dict[int, int]:
+        """マイルストーンの移行（GitLabマイルストーンID→GitHub番号のマッピングを返す）"""
+        milestone_mapping = {}
+        if not self.config.migrate_milestones:
+            return milestone_mapping
 
-                    logger.info(f"マイルストーン {milestone.title} を移行しました")
+        try:
+            milestones = gl_milestones if gl_milestones is not None else gitlab_project.milestones.list(get_all=True, per_page=100)
 
-                except Exception as e:
-                    logger.warning(f"マイルストーン {milestone.title} の移行に失敗しました: {e}")
+            # GitHub側に既に存在するものは作成せずマッピングだけ登録する
+            existing_milestones = gh_state['milestones'] if gh_state else {}
+            to_create = []
+            for milestone in milestones:
+                if milestone.title in existing_milestones:
+                    milestone_mapping[milestone.id] = existing_milestones[milestone.title]
+                else:
+                    to_create.append(milestone)
+
+            # マイルストーン同士も独立なので並列に作成し、結果は呼び出し側スレッドで集約する
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(self._create_one_milestone, github_repo, m) for m in to_create]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result:
+                        gl_id, gh_number = result
+                        milestone_mapping[gl_id] = gh_number
 
         except Exception as e:
             logger.error(f"マイルストーンの移行に失敗しました: {e}")
 
-    def migrate_git_repository(self, repo_info: Dict) -> bool:
+        return milestone_mapping
+
+    async def _run_git(self, *args: str):
+        """gitコマンドを非同期サブプロセスとして実行（失敗時は例外を送出）"""
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"git {' '.join(args)} が失敗しました: {stderr.decode(errors='replace').strip()}")
+
+    async def _migrate_git_repository_async(self, gitlab_url: str, github_url: str, mirror_dir: str,
+                                            auth_opts: tuple):
+        """クローン（または既存ミラーの差分更新）→pushを非同期に実行
+
+        gitlab_urlはトークンなしのURLを渡すこと。GitLabへの認証は毎回auth_opts
+        （-c http.<url>.extraheader=...）で渡し、ミラーキャッシュのconfigに
+        資格情報が書き残らないようにする。
+        """
+        if os.path.exists(os.path.join(mirror_dir, 'HEAD')):
+            # 既存ミラーがあれば再クローンせず差分だけ取得
+            # （以前の形式でトークン入りURLが保存されている場合もここで上書きされる）
+            await self._run_git(*auth_opts, "-C", mirror_dir, "remote", "set-url", "origin", gitlab_url)
+            await self._run_git(*auth_opts, "-C", mirror_dir, "remote", "update", "--prune")
+        else:
+            # クローン（partial_clone指定時はblobを遅延取得にして転送量を削減）
+            clone_args = ["clone", "--mirror"]
+            if self.config.partial_clone:
+                clone_args.append("--filter=blob:none")
+            await self._run_git(*auth_opts, *clone_args, gitlab_url, mirror_dir)
+        # GitHubへpush（--mirrorで強制上書き）。originはGitLabに向けたままpush先URLを
+        # 直接指定する（partial clone時の遅延blob取得はoriginから行われるため、
+        # pushにもGitLab向けのauth_optsを付けておく）
+        await self._run_git(*auth_opts, "-C", mirror_dir, "push", "--mirror", "--force", github_url)
+
+    def migrate_git_repository(self, repo_info: RepoInfo, github_repo) -> bool:
         """GitLabからGitHubへGitリポジトリ（履歴含む）を自動で移行（既存リポジトリにも強制push）"""
-        gitlab_url = repo_info['http_url_to_repo']
-        if gitlab_url.startswith('https://'):
-            gitlab_url = gitlab_url.replace('https://', f'https://oauth2:{self.config.gitlab_token}@')
-        github_url = self.github_org.get_repo(repo_info['name']).clone_url.replace('https://', f'https://{self.config.github_token}@')
-        temp_dir = f"_tmp_migrate_{repo_info['name']}"
+        gitlab_url = repo_info.http_url_to_repo
+        # GitLabトークンはURLに埋め込まず、git実行ごとにAuthorizationヘッダで渡す
+        # （URLに埋め込むとミラーキャッシュのconfigにトークンが永続化されてしまうため）
+        basic_auth = base64.b64encode(f"oauth2:{self.config.gitlab_token}".encode()).decode()
+        auth_opts = ("-c", f"http.{gitlab_url}.extraheader=Authorization: Basic {basic_auth}")
+        github_url = github_repo.clone_url.replace('https://', f'https://{self.config.github_token}@')
+
         try:
-            # クローン
-            subprocess.run(["git", "clone", "--mirror", gitlab_url, temp_dir], check=True)
-            # GitHubへpush（--mirrorで強制上書き）
-            subprocess.run(["git", "-C", temp_dir, "remote", "set-url", "origin", github_url], check=True)
-            subprocess.run(["git", "-C", temp_dir, "push", "--mirror", "--force"], check=True)
-            # 後片付け
-            subprocess.run(["rm", "-rf", temp_dir])
-            logger.info(f"Gitリポジトリ {repo_info['name']} のコード・履歴を移行しました（既存リポジトリも上書き）")
+            # 同時packfile転送数をセマフォで制限しつつ非同期に実行
+            with self._git_semaphore:
+                if self.config.mirror_cache_dir:
+                    # ミラーキャッシュが有効なら保持し、再実行時は差分更新だけで済ませる
+                    cache_root = os.path.expanduser(self.config.mirror_cache_dir)
+                    os.makedirs(cache_root, exist_ok=True)
+                    mirror_dir = os.path.join(cache_root, f"{repo_info.id}.git")
+                    asyncio.run(self._migrate_git_repository_async(gitlab_url, github_url, mirror_dir, auth_opts))
+                else:
+                    # 一時ディレクトリは成功・失敗に関わらずプロセス内で自動削除される
+                    with tempfile.TemporaryDirectory(prefix=f"migrate_{repo_info.name}_") as temp_dir:
+                        asyncio.run(self._migrate_git_repository_async(gitlab_url, github_url, temp_dir, auth_opts))
+            logger.info(f"Gitリポジトリ {repo_info.name} のコード・履歴を移行しました（既存リポジトリも上書き）")
             return True
         except Exception as e:
-            logger.error(f"Gitリポジトリ {repo_info['name']} のコード移行に失敗しました: {e}")
-            subprocess.run(["rm", "-rf", temp_dir])
+            logger.error(f"Gitリポジトリ {repo_info.name} のコード移行に失敗しました: {e}")
             return False
 
-    def migrate_issues(self, gitlab_project, github_repo):
-        """Issuesの移行"""
-        if not self.config.migrate_issues:
-            return
+    # レート制限チェックの間隔（秒）と待機を始める残リクエスト数の閾値
+    RATE_LIMIT_CHECK_INTERVAL = 30
+    RATE_LIMIT_THRESHOLD = 50
 
-        try:
-            issues = gitlab_project.issues.list(all=True)
-
-            # GitHub側の既存Issue一覧を取得（open/closed両方）
-            existing_issues = list(github_repo.get_issues(state='all'))
-            existing_issue_keys = set()
-            for ei in existing_issues:
-                # タイトルと状態で重複判定
-                existing_issue_keys.add((ei.title, ei.state))
+    # 403/429（secondary rate limit）の再試行回数と、Retry-After欠落時の既定待機秒
+    SECONDARY_LIMIT_RETRIES = 3
+    SECONDARY_LIMIT_DEFAULT_WAIT = 60
 
-            # GitHub側のラベル名一覧を取得
-            github_label_names = set(label.name for label in github_repo.get_labels())
-            # GitLab側のラベル情報をキャッシュ
-            gitlab_label_dict = {l.name: l for l in gitlab_project.labels.list()}
+    def _call_with_backoff(self, func, *args, **kwargs):
+        """GitHubへの書き込みを実行し、403/429はRetry-Afterを尊重して待機後に再試行する
 
-            for issue in tqdm(issues, desc="Issues移行中"):
-                try:
-                    # ラベルを取得（GitHub側に存在しない場合は自動作成）
-                    labels = []
-                    for label in issue.labels:
-                        if hasattr(label, 'name'):
-                            name = label.name
-                        elif isinstance(label, str):
-                            name = label
-                        else:
-                            continue
-                        if name not in github_label_names:
-                            # GitLab側のラベル情報を取得
-                            color = "ededed"
-                            description = ""
-                            if name in gitlab_label_dict:
-                                gl_label = gitlab_label_dict[name]
-                                color = gl_label.color.lstrip('#') if gl_label.color else "ededed"
-                                description = gl_label.description or ""
-                            try:
-                                github_repo.create_label(name=name, color=color, description=description)
-                                # ラベル作成後はキャッシュを再取得
-                                github_label_names = set(label.name for label in github_repo.get_labels())
-                                logger.info(f"GitHubにラベル {name} を自動作成しました")
-                            except Exception as e:
-                                logger.warning(f"GitHubラベル {name} の自動作成に失敗: {e}")
-                                continue
-                        labels.append(name)
+        POSTはurllib3のRetryでは再試行されない（盲目的な再試行は重複作成の恐れが
+        あるため敢えて許可しない）ので、拒否されたと明示された場合だけここで再送する。
+        """
+        for attempt in range(self.SECONDARY_LIMIT_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except GithubException as e:
+                if e.status not in (403, 429) or attempt >= self.SECONDARY_LIMIT_RETRIES:
+                    raise
+                headers = e.headers or {}
+                retry_after = headers.get('retry-after') or headers.get('Retry-After')
+                wait = int(retry_after) if retry_after else self.SECONDARY_LIMIT_DEFAULT_WAIT
+                logger.warning(f"GitHub APIが {e.status} を返したため {wait} 秒待機して再試行します")
+                time.sleep(wait)
+
+    def _maybe_throttle(self):
+        """GitHubレート制限の残量を確認し、枯渇が近い場合のみリセットまで待機する"""
+        now = time.time()
+        with self._rate_limit_lock:
+            if now - self._rate_limit_checked_at < self.RATE_LIMIT_CHECK_INTERVAL:
+                return
+            self._rate_limit_checked_at = now
 
-                    # マイルストーンを設定
-                    milestone = None
-                    if hasattr(issue, 'milestone') and issue.milestone:
-                        milestone_number = self.milestone_mapping.get(issue.milestone.id)
-                        if milestone_number:
-                            milestone = github_repo.get_milestone(milestone_number)
+        try:
+            core = self.github.get_rate_limit().core
+        except Exception as e:
+            logger.warning(f"レート制限情報の取得に失敗しました: {e}")
+            return
 
-                    # bodyがNoneの場合は空文字
-                    body = issue.description if issue.description is not None else ""
+        if core.remaining < self.RATE_LIMIT_THRESHOLD:
+            # core.resetはナイーブなUTC datetimeなので、UTCを明示してからepochへ変換する
+            reset_ts = core.reset.replace(tzinfo=timezone.utc).timestamp()
+            wait = max(0.0, reset_ts - time.time()) + 1
+            logger.warning(f"GitHub APIの残リクエスト数が {core.remaining} のため {wait:.0f} 秒待機します")
+            time.sleep(wait)
 
-                    # 重複判定（タイトル・状態）
-                    issue_state = 'closed' if issue.state == 'closed' else 'open'
-                    if (issue.title, issue_state) in existing_issue_keys:
-                        logger.info(f"Issue {issue.iid}（{issue.title}）は既に存在するためスキップ")
-                        continue
+    def _ensure_github_label(self, github_repo, name: str, gitlab_label_dict: Dict, github_label_names: set) -> bool:
+        """GitHub側にラベルが無ければ自動作成し、キャッシュ済みのラベル名セットを更新"""
+        if name in github_label_names:
+            return True
 
-                    # Issueを作成
-                    try:
-                        issue_kwargs = {
-                            'title': issue.title,
-                            'body': body,
-                        }
-                        if labels:
-                            issue_kwargs['labels'] = labels
-                        if milestone is not None:
-                            issue_kwargs['milestone'] = milestone
-                        logger.info(f"Issue {issue.iid} 作成時の引数: {issue_kwargs}")
-                        gh_issue = github_repo.create_issue(**issue_kwargs)
-                    except AssertionError as ae:
-                        logger.warning(f"Issue {issue.iid} のラベル指定でAssertionError: {ae}, labels={labels}")
-                        continue
+        # GitLab側のラベル情報を取得
+        color = "ededed"
+        description = ""
+        if name in gitlab_label_dict:
+            gl_label = gitlab_label_dict[name]
+            color = gl_label.color.lstrip('#') if gl_label.color else "ededed"
+            description = gl_label.description or ""
+        try:
+            self._call_with_backoff(github_repo.create_label, name=name, color=color, description=description)
+            # 再取得せずキャッシュに追加するだけでよい
+            github_label_names.add(name)
+            logger.info(f"GitHubにラベル {name} を自動作成しました")
+            return True
+        except GithubException as e:
+            # 既に存在する場合（422）は付与可能なので成功として扱う
+            if e.status == 422:
+                github_label_names.add(name)
+                return True
+            logger.warning(f"GitHubラベル {name} の自動作成に失敗: {e}")
+            return False
+        except Exception as e:
+            logger.warning(f"GitHubラベル {name} の自動作成に失敗: {e}")
+            return False
 
-                    # コメントを移行
-                    notes = issue.notes.list()
-                    for note in notes:
-                        if note.body and note.body.strip():
-                            gh_issue.create_comment(note.body)
+    def migrate_issues(self, gitlab_project, github_repo, milestone_mapping: Dict[int, int],
+                       gl_labels: Optional[List] = None, gh_state: Optional[Dict] = None, position: int = 0):
+        """Issuesの移行"""
+        if not self.config.migrate_issues:
+            return
 
-                    # 状態を設定
-                    if issue.state == 'closed':
-                        gh_issue.edit(state='closed')
+        try:
+            # iterator=Trueで全件を遅延ページング（100件/ページ）
+            issues = gitlab_project.issues.list(iterator=True, per_page=100)
+
+            # GitHub側の既存状態（呼び出し元から渡されなければここで先読み）
+            if gh_state is None:
+                gh_state = self._prefetch_github_state(github_repo.name)
+            # 既存Issue本文のiidマーカー（再実行時の冪等性確保）
+            existing_iids = gh_state['issue_iids']
+            # GitHub側のラベル名一覧（以降はこのセットを更新して使い回す）
+            github_label_names = gh_state['label_names']
+            # GitLab側のラベル情報をキャッシュ（呼び出し元から渡されたものを再利用）
+            if gl_labels is None:
+                gl_labels = gitlab_project.labels.list(get_all=True, per_page=100)
+            gitlab_label_dict = {l.name: l for l in gl_labels}
+
+            # GitLab側の読み取りとラベル補完は逐次で行い、作成ペイロードを組み立てる
+            items = []
+            for issue in tqdm(issues, desc="Issues準備中", position=position, leave=False):
+                try:
+                    # 重複判定（ローカルチェックポイント→API側のiidマーカーの順）
+                    if self._checkpoint_done(github_repo.name, 'issue', issue.iid):
+                        logger.info(f"Issue {issue.iid}（{issue.title}）は移行済みのためスキップ")
+                        continue
+                    if issue.iid in existing_iids:
+                        logger.info(f"Issue {issue.iid}（{issue.title}）は既に存在するためスキップ")
+                        continue
 
-                    logger.info(f"Issue {issue.iid} を移行しました")
+                    # ラベルを取得（GitHub側に存在しない場合は自動作成）
+                    labels = []
+                    for name in _label_names(issue.labels):
+                        if self._ensure_github_label(github_repo, name, gitlab_label_dict, github_label_names):
+                            labels.append(name)
 
-                    # API制限を避けるため少し待機
-                    time.sleep(0.1)
+                    # マイルストーンはREST APIが番号を直接受け取るのでGETし直す必要がない
+                    milestone_number = None
+                    if hasattr(issue, 'milestone') and issue.milestone:
+                        milestone_number = milestone_mapping.get(issue.milestone.id)
+
+                    items.append({
+                        'iid': issue.iid,
+                        'title': issue.title,
+                        # 本文末尾に機械可読なiidマーカーを埋め込む（再実行時の重複判定用）
+                        'body': f"{issue.description or ''}\n\n<!-- gitlab-iid: {issue.iid} -->",
+                        'labels': labels,
+                        'milestone': milestone_number,
+                        'closed': issue.state == 'closed',
+                        'comments': [n.body.strip() for n in issue.notes.list(iterator=True, per_page=100)
+                                     if n.body and n.body.strip()],
+                    })
 
                 except Exception as e:
-                    logger.warning(f"Issue {issue.iid} の移行に失敗しました: {e}")
-                    # 例外の詳細も出力
-                    if hasattr(e, 'data'):
-                        logger.warning(f"GitHub API response: {e.data}")
-                    if hasattr(e, 'status'):
-                        logger.warning(f"GitHub API status: {e.status}")
-                    logger.warning(f"Exception type: {type(e)}")
+                    logger.warning(f"Issue {issue.iid} の移行準備に失敗しました: {e}")
+
+            # GitHubへの書き込みはbulk importエンドポイントへIssue単位に並列投入する
+            if items:
+                asyncio.run(self._import_issues_async(github_repo.name, items))
 
         except Exception as e:
             logger.error(f"Issuesの移行に失敗しました: {e}")
 
-    def migrate_merge_requests(self, gitlab_project, github_repo):
+    async def _gh_request(self, session: aiohttp.ClientSession, method: str, path: str,
+                          payload: Optional[Dict] = None) -> Dict:
+        """GitHub REST APIへ非同期にリクエストを送り、JSONレスポンスを返す"""
+        url = path if path.startswith('https://') else f"{GITHUB_API_URL}{path}"
+        for attempt in range(self.SECONDARY_LIMIT_RETRIES + 1):
+            async with session.request(method, url, json=payload) as response:
+                data = await response.json()
+                # 403/429はレート制限なので、Retry-Afterを尊重して待機後に再送する
+                if response.status in (403, 429) and attempt < self.SECONDARY_LIMIT_RETRIES:
+                    retry_after = response.headers.get('Retry-After')
+                    wait = int(retry_after) if retry_after else self.SECONDARY_LIMIT_DEFAULT_WAIT
+                    logger.warning(f"GitHub APIが {response.status} を返したため {wait} 秒待機して再試行します")
+                    await asyncio.sleep(wait)
+                    continue
+                if response.status >= 400:
+                    raise RuntimeError(f"GitHub API {method} {path} が失敗しました: {response.status} {data}")
+                return data
+
+    async def _import_one_issue_async(self, session: aiohttp.ClientSession,
+                                      semaphore: asyncio.Semaphore, repo_name: str, item: Dict) -> str:
+        """Issue1件（コメント・クローズ状態込み）をimportエンドポイントへ投入し、ステータスURLを返す"""
+        async with semaphore:
+            issue_payload = {
+                'title': item['title'],
+                'body': item['body'],
+                'closed': item['closed'],
+            }
+            if item['labels']:
+                issue_payload['labels'] = item['labels']
+            if item['milestone']:
+                issue_payload['milestone'] = item['milestone']
+
+            payload = {'issue': issue_payload}
+            if item['comments']:
+                payload['comments'] = [{'body': c} for c in item['comments']]
+
+            result = await self._gh_request(
+                session, 'POST',
+                f"/repos/{self.config.github_org}/{repo_name}/import/issues",
+                payload
+            )
+            logger.info(f"Issue {item['iid']} をインポート投入しました")
+
+            # レート制限の残量を確認し、必要な場合のみ待機
+            await asyncio.to_thread(self._maybe_throttle)
+            return result['url']
+
+    async def _import_issues_async(self, repo_name: str, items: List[Dict]):
+        """準備済みのIssueペイロードを並列投入し、最後にまとめて完了をポーリングする"""
+        semaphore = asyncio.Semaphore(max(1, self.config.http_concurrency))
+        headers = {
+            'Authorization': f'token {self.config.github_token}',
+            # Issue importエンドポイント（golden-comet preview）用のAcceptヘッダ
+            'Accept': 'application/vnd.github.golden-comet-preview+json',
+        }
+        async with aiohttp.ClientSession(headers=headers) as session:
+            results = await asyncio.gather(
+                *[self._import_one_issue_async(session, semaphore, repo_name, item) for item in items],
+                return_exceptions=True
+            )
+
+            # 投入に成功したものはステータスURL→アイテムで保持し、完了を待つ
+            pending = {}
+            for item, result in zip(items, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Issue {item['iid']} のインポート投入に失敗しました: {result}")
+                else:
+                    pending[result] = item
+
+            for _ in range(60):
+                if not pending:
+                    break
+                for status_url in list(pending):
+                    item = pending[status_url]
+                    try:
+                        status = await self._gh_request(session, 'GET', status_url)
+                    except Exception as e:
+                        logger.warning(f"Issue {item['iid']} のインポート状態確認に失敗しました: {e}")
+                        del pending[status_url]
+                        continue
+                    if status.get('status') == 'imported':
+                        # 作成されたIssue番号とあわせてチェックポイントへ記録
+                        gh_number = None
+                        issue_url = status.get('issue_url') or ''
+                        if issue_url:
+                            gh_number = int(issue_url.rstrip('/').rsplit('/', 1)[-1])
+                        self._checkpoint_record(repo_name, 'issue', item['iid'], gh_number)
+                        logger.info(f"Issue {item['iid']} を移行しました")
+                        del pending[status_url]
+                    elif status.get('status') == 'failed':
+                        logger.warning(f"Issue {item['iid']} のインポートに失敗しました: {status.get('errors')}")
+                        del pending[status_url]
+                if pending:
+                    await asyncio.sleep(2)
+
+            for item in pending.values():
+                logger.warning(f"Issue {item['iid']} のインポート完了を確認できませんでした")
+
+    def migrate_merge_requests(self, gitlab_project, github_repo, milestone_mapping: Dict[int, int],
+                               gl_labels: Optional[List] = None, gh_state: Optional[Dict] = None, position: int = 0):
         """Merge Requestsの移行"""
         if not self.config.migrate_merge_requests:
             return
 
         try:
-            merge_requests = gitlab_project.mergerequests.list(all=True)
-
-            for mr in tqdm(merge_requests, desc="Merge Requests移行中"):
+            # iterator=Trueで全件を遅延ページング（100件/ページ）
+            merge_requests = gitlab_project.mergerequests.list(iterator=True, per_page=100)
+
+            # GitHub側の既存状態（呼び出し元から渡されなければここで先読み）
+            if gh_state is None:
+                gh_state = self._prefetch_github_state(github_repo.name)
+            # GitHub側のラベル名一覧（以降はこのセットを更新して使い回す）
+            github_label_names = gh_state['label_names']
+            # 既存PR・スキップ記録Issue本文のMR iidマーカー（再実行時の冪等性確保）
+            existing_mr_iids = gh_state['mr_iids']
+            # GitLab側のラベル情報をキャッシュ（呼び出し元から渡されたものを再利用）
+            if gl_labels is None:
+                gl_labels = gitlab_project.labels.list(get_all=True, per_page=100)
+            gitlab_label_dict = {l.name: l for l in gl_labels}
+
+            # ブランチ一覧はループ中に変化しないので一度だけ取得
+            branches = {b.name for b in github_repo.get_branches()}
+            # 取得済みマイルストーンオブジェクトのキャッシュ
+            milestone_cache: Dict[int, Any] = {}
+
+            for mr in tqdm(merge_requests, desc="Merge Requests移行中", position=position, leave=False):
                 try:
+                    # 重複判定（ローカルチェックポイント→API側のiidマーカーの順）
+                    if self._checkpoint_done(github_repo.name, 'mr', mr.iid):
+                        logger.info(f"MR {mr.iid}（{mr.title}）は移行済みのためスキップ")
+                        continue
+                    if mr.iid in existing_mr_iids:
+                        logger.info(f"MR {mr.iid}（{mr.title}）は既に存在するためスキップ")
+                        continue
+
                     # ブランチ存在チェック
-                    branches = [b.name for b in github_repo.get_branches()]
                     if mr.source_branch not in branches or mr.target_branch not in branches:
                         logger.warning(f"MR {mr.iid}: ブランチが存在しないためスキップ (source: {mr.source_branch}, target: {mr.target_branch})")
                         # スキップ情報をIssueとして記録し、すぐにクローズ
@@ -375,58 +800,68 @@ class GitLabToGitHubMigrator:
 - ターゲットブランチ: {mr.target_branch}
 - 理由: GitHub上に該当ブランチが存在しないためPull Requestとして作成できませんでした。
 - 元GitLab URL: {getattr(mr, 'web_url', '')}
+
+<!-- gitlab-mr-iid: {mr.iid} -->
 """
-                        gh_issue = github_repo.create_issue(title=issue_title, body=issue_body)
-                        gh_issue.edit(state='closed')
+                        gh_issue = self._call_with_backoff(
+                            github_repo.create_issue, title=issue_title, body=issue_body)
+                        self._call_with_backoff(gh_issue.edit, state='closed')
+                        self._checkpoint_record(github_repo.name, 'mr', mr.iid, gh_issue.number)
                         logger.info(f"MR {mr.iid}: スキップし、内容をIssue（クローズ済み）として記録しました")
                         continue
-                    # ラベルを取得
+                    # ラベルを取得（GitHub側に存在しない場合は自動作成）
                     labels = []
-                    for label in mr.labels:
-                        if hasattr(label, 'name'):
-                            labels.append(label.name)
-                        elif isinstance(label, str):
-                            labels.append(label)
+                    for name in _label_names(mr.labels):
+                        if self._ensure_github_label(github_repo, name, gitlab_label_dict, github_label_names):
+                            labels.append(name)
 
                     # マイルストーンを設定
                     milestone = None
                     if hasattr(mr, 'milestone') and mr.milestone:
-                        milestone_number = self.milestone_mapping.get(mr.milestone.id)
+                        milestone_number = milestone_mapping.get(mr.milestone.id)
                         if milestone_number:
-                            milestone = github_repo.get_milestone(milestone_number)
-
-                    # Pull Requestを作成
-                    gh_pr = github_repo.create_pull(
+                            # 同じマイルストーンを何度もGETしないようキャッシュする
+                            if milestone_number not in milestone_cache:
+                                milestone_cache[milestone_number] = github_repo.get_milestone(milestone_number)
+                            milestone = milestone_cache[milestone_number]
+
+                    # Pull Requestを作成（本文末尾にiidマーカーを埋め込む）
+                    gh_pr = self._call_with_backoff(
+                        github_repo.create_pull,
                         title=mr.title,
-                        body=mr.description or '',
+                        body=f"{mr.description or ''}\n\n<!-- gitlab-mr-iid: {mr.iid} -->",
                         head=mr.source_branch,
                         base=mr.target_branch
                     )
+                    self._checkpoint_record(github_repo.name, 'mr', mr.iid, gh_pr.number)
 
                     # ラベルを設定
                     if labels:
-                        gh_pr.add_to_labels(*labels)
+                        self._call_with_backoff(gh_pr.add_to_labels, *labels)
 
                     # マイルストーンを設定
                     if milestone:
-                        gh_pr.add_to_assignees(milestone)
+                        self._call_with_backoff(gh_pr.add_to_assignees, milestone)
 
-                    # コメントを移行
-                    notes = mr.notes.list()
-                    for note in notes:
-                        if note.body and note.body.strip():
-                            gh_pr.create_issue_comment(note.body)
+                    # コメントを移行（コメント同士は独立なので並列にPOSTする）
+                    comments = [n.body.strip() for n in mr.notes.list(iterator=True, per_page=100)
+                                if n.body and n.body.strip()]
+                    if comments:
+                        with ThreadPoolExecutor(max_workers=8) as executor:
+                            list(executor.map(
+                                lambda body: self._call_with_backoff(gh_pr.create_issue_comment, body),
+                                comments))
 
                     # 状態を設定
                     if mr.state == 'merged':
-                        gh_pr.edit(state='closed')
+                        self._call_with_backoff(gh_pr.edit, state='closed')
                     elif mr.state == 'closed':
-                        gh_pr.edit(state='closed')
+                        self._call_with_backoff(gh_pr.edit, state='closed')
 
                     logger.info(f"Merge Request {mr.iid} を移行しました")
 
-                    # API制限を避けるため少し待機
-                    time.sleep(0.1)
+                    # レート制限の残量を確認し、必要な場合のみ待機
+                    self._maybe_throttle()
 
                 except Exception as e:
                     logger.warning(f"Merge Request {mr.iid} の移行に失敗しました: {e}")
@@ -434,36 +869,42 @@ class GitLabToGitHubMigrator:
         except Exception as e:
             logger.error(f"Merge Requestsの移行に失敗しました: {e}")
 
-    def migrate_repository(self, repo_info: Dict):
+    def migrate_repository(self, repo_info: RepoInfo, position: int = 0):
         """単一リポジトリの移行"""
         try:
-            logger.info(f"リポジトリ {repo_info['name']} の移行を開始します")
+            logger.info(f"リポジトリ {repo_info.name} の移行を開始します")
 
             # GitLabプロジェクトを取得
-            gitlab_project = self.gitlab.projects.get(repo_info['id'])
+            gitlab_project = self.gitlab.projects.get(repo_info.id)
 
-            # GitHubリポジトリを作成
-            github_repo_url = self.create_github_repository(repo_info)
-            if not github_repo_url:
-                logger.error(f"GitHubリポジトリの作成に失敗しました: {repo_info['name']}")
+            # GitHubリポジトリを作成（Repositoryオブジェクトをそのまま使い回す）
+            github_repo = self.create_github_repository(repo_info)
+            if not github_repo:
+                logger.error(f"GitHubリポジトリの作成に失敗しました: {repo_info.name}")
                 return False
 
-            github_repo = self.github_org.get_repo(repo_info['name'])
-
             # コード・履歴を移行
-            self.migrate_git_repository(repo_info)
+            self.migrate_git_repository(repo_info, github_repo)
 
-            # 各要素を移行
-            self.migrate_labels(gitlab_project, github_repo)
-            self.migrate_milestones(gitlab_project, github_repo)
-            self.migrate_issues(gitlab_project, github_repo)
-            self.migrate_merge_requests(gitlab_project, github_repo)
+            # ラベル・マイルストーンはプロジェクトごとに1回だけ取得して各処理へ渡す
+            # （複数回イテレートするのでget_all=Trueでリストとして取得）
+            gl_labels = gitlab_project.labels.list(get_all=True, per_page=100)
+            gl_milestones = gitlab_project.milestones.list(get_all=True, per_page=100)
 
-            logger.info(f"リポジトリ {repo_info['name']} の移行が完了しました")
+            # GitHub側の既存状態も1つのGraphQLクエリでまとめて先読みする
+            gh_state = self._prefetch_github_state(github_repo.name)
+
+            # 各要素を移行（マッピングはリポジトリ単位のローカル変数として引き回す）
+            self.migrate_labels(gitlab_project, github_repo, gl_labels=gl_labels, gh_state=gh_state)
+            milestone_mapping = self.migrate_milestones(gitlab_project, github_repo, gl_milestones=gl_milestones, gh_state=gh_state)
+            self.migrate_issues(gitlab_project, github_repo, milestone_mapping, gl_labels=gl_labels, gh_state=gh_state, position=position)
+            self.migrate_merge_requests(gitlab_project, github_repo, milestone_mapping, gl_labels=gl_labels, gh_state=gh_state, position=position)
+
+            logger.info(f"リポジトリ {repo_info.name} の移行が完了しました")
             return True
 
         except Exception as e:
-            logger.error(f"リポジトリ {repo_info['name']} の移行に失敗しました: {e}")
+            logger.error(f"リポジトリ {repo_info.name} の移行に失敗しました: {e}")
             return False
 
     def run_migration(self):
@@ -490,11 +931,21 @@ class GitLabToGitHubMigrator:
             logger.error("移行するリポジトリが見つかりませんでした")
             return
 
-        # 各リポジトリを移行
+        # 各リポジトリを並列に移行（I/Oバウンドなのでスレッドプールで十分）
         success_count = 0
-        for repo_info in repositories:
-            if self.migrate_repository(repo_info):
-                success_count += 1
+        max_workers = max(1, self.config.concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.migrate_repository, repo_info, position=i % max_workers): repo_info
+                for i, repo_info in enumerate(repositories)
+            }
+            for future in as_completed(futures):
+                repo_info = futures[future]
+                try:
+                    if future.result():
+                        success_count += 1
+                except Exception as e:
+                    logger.error(f"リポジトリ {repo_info.name} の移行中に例外が発生しました: {e}")
 
         logger.info(f"移行完了: {success_count}/{len(repositories)} リポジトリが正常に移行されました")
 
@@ -514,7 +965,13 @@ def load_config() -> MigrationConfig:
         migrate_wiki=os.getenv('MIGRATE_WIKI', 'true').lower() == 'true',
         migrate_labels=os.getenv('MIGRATE_LABELS', 'true').lower() == 'true',
         migrate_milestones=os.getenv('MIGRATE_MILESTONES', 'true').lower() == 'true',
-        force_private=os.getenv('FORCE_PRIVATE', 'false').lower() == 'true'
+        force_private=os.getenv('FORCE_PRIVATE', 'false').lower() == 'true',
+        concurrency=int(os.getenv('MIGRATION_CONCURRENCY', '4')),
+        git_concurrency=int(os.getenv('GIT_CONCURRENCY', '2')),
+        partial_clone=os.getenv('PARTIAL_CLONE', 'false').lower() == 'true',
+        http_concurrency=int(os.getenv('HTTP_CONCURRENCY', '8')),
+        mirror_cache_dir=os.getenv('MIRROR_CACHE_DIR', '~/.cache/gitlab2github'),
+        state_db=os.getenv('MIGRATION_STATE_DB', 'migration_state.sqlite')
     )
 
 
@@ -526,6 +983,7 @@ def main():
     parser.add_argument('--list', '-l', action='store_true', help='利用可能なリポジトリ一覧を表示')
     parser.add_argument('--dry-run', action='store_true', help='実際の移行は行わず、移行対象を表示')
     parser.add_argument('--force-private', action='store_true', help='すべてprivateリポジトリとして作成する')
+    parser.add_argument('--concurrency', '-c', type=int, help='同時に移行するリポジトリ数')
 
     args = parser.parse_args()
 
@@ -536,6 +994,10 @@ def main():
         if args.force_private:
             config.force_private = True
 
+        # コマンドライン引数でconcurrencyが指定された場合は上書き
+        if args.concurrency:
+            config.concurrency = args.concurrency
+
         # 必須設定のチェック
         required_fields = [
             'gitlab_url', 'gitlab_token', 'gitlab_group_id',
@@ -560,7 +1022,7 @@ def main():
                 print("\n📋 利用可能なリポジトリ一覧:")
                 print("=" * 50)
                 for repo in repositories:
-                    print(f"• {repo['name']} - {repo.get('description', '説明なし')}")
+                    print(f"• {repo.name} - {repo.description or '説明なし'}")
                 print(f"\n合計: {len(repositories)} 個のリポジトリ")
             else:
                 print("❌ リポジトリが見つかりませんでした")
@@ -572,10 +1034,10 @@ def main():
             if config.target_repo:
                 repo_info = migrator.get_specific_repository(config.target_repo)
                 if repo_info:
-                    print(f"\n🔍 移行対象: {repo_info['name']}")
-                    print(f"   説明: {repo_info.get('description', '説明なし')}")
-                    print(f"   可視性: {repo_info['visibility']}")
-                    print(f"   URL: {repo_info['web_url']}")
+                    print(f"\n🔍 移行対象: {repo_info.name}")
+                    print(f"   説明: {repo_info.description or '説明なし'}")
+                    print(f"   可視性: {repo_info.visibility}")
+                    print(f"   URL: {repo_info.web_url}")
                 else:
                     print(f"❌ リポジトリ {config.target_repo} が見つかりませんでした")
             else:
@@ -583,7 +1045,7 @@ def main():
                 if repositories:
                     print(f"\n🔍 移行対象: {len(repositories)} 個のリポジトリ")
                     for repo in repositories:
-                        print(f"   • {repo['name']}")
+                        print(f"   • {repo.name}")
                 else:
                     print("❌ 移行対象のリポジトリが見つかりませんでした")
             return
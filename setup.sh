@@ -8,10 +8,10 @@ python_version_full=$(python3 --version 2>&1 | grep -oE '[0-9]+\.[0-9]+\.[0-9]+'
 python_major=$(echo $python_version_full | cut -d. -f1)
 python_minor=$(echo $python_version_full | cut -d. -f2)
 
-if [ "$python_major" -gt 3 ] || { [ "$python_major" -eq 3 ] && [ "$python_minor" -ge 7 ]; }; then
-    echo "Python 3.7+ が確認されました: $(python3 --version)"
+if [ "$python_major" -gt 3 ] || { [ "$python_major" -eq 3 ] && [ "$python_minor" -ge 10 ]; }; then
+    echo "Python 3.10+ が確認されました: $(python3 --version)"
 else
-    echo "Python 3.7+ が必要です。現在のバージョン: $(python3 --version)"
+    echo "Python 3.10+ が必要です。現在のバージョン: $(python3 --version)"
     exit 1
 fi
 